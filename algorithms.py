@@ -5,7 +5,7 @@ from enum import Enum, auto
 from heapq import heappop, heappush
 from itertools import count
 
-from grid import CellIndex, CellType, Grid
+from grid import DEFAULT_COST_PROFILE, CellIndex, CostProfile, Grid
 
 
 class CellDynState(Enum):
@@ -15,7 +15,10 @@ class CellDynState(Enum):
 
 
 def bfs(
-    grid: Grid, start: CellIndex, goal: CellIndex
+    grid: Grid,
+    start: CellIndex,
+    goal: CellIndex,
+    profile: CostProfile = DEFAULT_COST_PROFILE,
 ) -> Generator[tuple[CellIndex, CellDynState]]:
     queue = deque([start])
     visited = set([start])
@@ -30,8 +33,8 @@ def bfs(
 
         for neighbour in grid.get_neighbours(*current):
             if neighbour not in visited:
-                cell_type = grid.get_cell_type(*neighbour)
-                if cell_type != CellType.WALL:
+                cell_cost = grid.get_cell_cost(*neighbour, profile)
+                if not math.isinf(cell_cost):
                     visited.add(neighbour)
                     parents[neighbour] = current
                     queue.append(neighbour)
@@ -50,7 +53,10 @@ def bfs(
 
 
 def dijkstra(
-    grid: Grid, start: CellIndex, goal: CellIndex
+    grid: Grid,
+    start: CellIndex,
+    goal: CellIndex,
+    profile: CostProfile = DEFAULT_COST_PROFILE,
 ) -> Generator[tuple[CellIndex, CellDynState]]:
     counter = count()
     min_distances: dict[CellIndex, float] = {start: 0}
@@ -70,7 +76,7 @@ def dijkstra(
             break
 
         for neighbour in grid.get_neighbours(*current):
-            cell_cost = grid.get_cell_cost(*neighbour)
+            cell_cost = grid.get_cell_cost(*neighbour, profile)
             if math.isinf(cell_cost):
                 continue
 
@@ -97,7 +103,10 @@ def dijkstra(
 
 
 def A_star(
-    grid: Grid, start: CellIndex, goal: CellIndex
+    grid: Grid,
+    start: CellIndex,
+    goal: CellIndex,
+    profile: CostProfile = DEFAULT_COST_PROFILE,
 ) -> Generator[tuple[CellIndex, CellDynState]]:
     # g: cout reel
     # h: heuristique
@@ -105,12 +114,15 @@ def A_star(
     counter = count()
     min_gscore: dict[CellIndex, float] = {start: 0}
     parents = dict()
+    h_scale = min_cost(profile)
 
-    min_heap = [(min_gscore[start] + h(start, goal), next(counter), start)]
+    min_heap = [
+        (min_gscore[start] + h(start, goal, h_scale), next(counter), start)
+    ]
 
     while min_heap:
         current_fscore, _, current = heappop(min_heap)
-        if current_fscore - h(current, goal) > min_gscore[current]:
+        if current_fscore - h(current, goal, h_scale) > min_gscore[current]:
             # Cas ou on a trouvé un chemin plus court vers la cellule entre temps : on ignore le chemin long
             continue
 
@@ -120,7 +132,7 @@ def A_star(
             break
 
         for neighbour in grid.get_neighbours(*current):
-            cell_cost = grid.get_cell_cost(*neighbour)
+            cell_cost = grid.get_cell_cost(*neighbour, profile)
             if math.isinf(cell_cost):
                 continue
 
@@ -130,7 +142,11 @@ def A_star(
                 parents[neighbour] = current
                 heappush(
                     min_heap,
-                    (neighbour_gscore + h(neighbour, goal), next(counter), neighbour),
+                    (
+                        neighbour_gscore + h(neighbour, goal, h_scale),
+                        next(counter),
+                        neighbour,
+                    ),
                 )
                 yield neighbour, CellDynState.QUEUED
 
@@ -146,6 +162,15 @@ def A_star(
             yield node, CellDynState.PATH
 
 
-def h(cell: CellIndex, goal: CellIndex):
+def min_cost(profile: CostProfile) -> float:
+    # Plus petit cout fini du profil (voir make_cost_profile pour la validation)
+    finite_costs = [cost for cost in profile.values() if not math.isinf(cost)]
+    if not finite_costs or min(finite_costs) < 0:
+        raise ValueError("cost profile must have a non-negative finite cost")
+    return min(finite_costs)
+
+
+def h(cell: CellIndex, goal: CellIndex, scale: float = 1):
     # Heuristique qui estime la distance par rapport à la cible
-    return abs(cell[0] - goal[0]) + abs(cell[1] - goal[1])
+    # scale doit etre le cout minimal d'une cellule pour rester admissible
+    return scale * (abs(cell[0] - goal[0]) + abs(cell[1] - goal[1]))
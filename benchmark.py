@@ -0,0 +1,53 @@
+import tracemalloc
+
+from grid import (
+    BOAT_COST_PROFILE,
+    DEFAULT_COST_PROFILE,
+    CellType,
+    Grid,
+    make_cost_profile,
+)
+
+WIDTH = 500
+HEIGHT = 500
+AGENT_TYPES = 8
+
+
+def make_grid() -> Grid:
+    grid = Grid(WIDTH, HEIGHT)
+    for row in range(HEIGHT):
+        for col in range(0, WIDTH, 3):
+            grid.set_cell(row, col, CellType.WATER)
+    return grid
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    result = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def duplicated_grids():
+    # Une grille par type d'agent
+    return [make_grid() for _ in range(AGENT_TYPES)]
+
+
+def shared_grid_with_profiles():
+    # Une seule grille partagee, un profil de couts par type d'agent
+    profiles = [
+        make_cost_profile(DEFAULT_COST_PROFILE if i % 2 else BOAT_COST_PROFILE)
+        for i in range(AGENT_TYPES)
+    ]
+    return make_grid(), profiles
+
+
+if __name__ == "__main__":
+    duplicated = measure(duplicated_grids)
+    shared = measure(shared_grid_with_profiles)
+    print(f"{AGENT_TYPES} types d'agents sur une grille {WIDTH}x{HEIGHT}")
+    print(f"Grilles dupliquees : {duplicated / 1e6:.2f} Mo")
+    print(f"Grille partagee + profils : {shared / 1e6:.2f} Mo")
+    print(f"Memoire economisee : {(duplicated - shared) / 1e6:.2f} Mo")
@@ -1,5 +1,8 @@
+import math
 import random
+from collections.abc import Mapping
 from enum import Enum, auto
+from types import MappingProxyType
 
 CellIndex = tuple[int, int]
 
@@ -13,6 +16,41 @@ class CellType(Enum):
     GOAL = auto()
 
 
+# Table de couts par type de cellule, propre a un type d'agent.
+# Un type de cellule absent de la table est infranchissable.
+CostProfile = Mapping[CellType, float]
+
+
+def make_cost_profile(costs: Mapping[CellType, float]) -> CostProfile:
+    # Valide la table et la rend non modifiable pour isoler les agents entre eux
+    for cell_type, cost in costs.items():
+        if not cost >= 0:
+            raise ValueError(f"invalid cost {cost} for {cell_type}")
+    if all(math.isinf(cost) for cost in costs.values()):
+        raise ValueError("cost profile has no traversable cell type")
+    return MappingProxyType(dict(costs))
+
+
+DEFAULT_COST_PROFILE = make_cost_profile(
+    {
+        CellType.EMPTY: 1,
+        CellType.SAND: 2,
+        CellType.WATER: 5,
+        CellType.BEGIN: 1,
+        CellType.GOAL: 1,
+        CellType.WALL: math.inf,
+    }
+)
+
+BOAT_COST_PROFILE = make_cost_profile(
+    {
+        CellType.WATER: 1,
+        CellType.BEGIN: 1,
+        CellType.GOAL: 1,
+    }
+)
+
+
 class Grid:
     def __init__(self, width: int, height: int):
         self.width = width
@@ -32,21 +70,10 @@ class Grid:
             for col in range(self.width):
                 self.set_cell(row, col, CellType.EMPTY)
 
-    def get_cell_cost(self, row: int, col: int) -> float:
-        state = self.get_cell_type(row, col)
-        match state:
-            case CellType.EMPTY:
-                return 1
-            case CellType.SAND:
-                return 2
-            case CellType.WATER:
-                return 5
-            case CellType.BEGIN:
-                return 1
-            case CellType.GOAL:
-                return 1
-            case CellType.WALL:
-                return float("inf")
+    def get_cell_cost(
+        self, row: int, col: int, profile: CostProfile = DEFAULT_COST_PROFILE
+    ) -> float:
+        return profile.get(self.get_cell_type(row, col), math.inf)
 
     def get_neighbours(self, row: int, col: int) -> list[CellIndex]:
         neighbours = []
@@ -71,18 +98,18 @@ class Grid:
         return neighbours
 
     def toggle_cell_type(self, row: int, col: int, cell_type: CellType) -> CellType:
-        if self.cells[row][col] == cell_type:
+        if self.get_cell_type(row, col) == cell_type:
             value = CellType.EMPTY
         else:
             value = cell_type
-        self.cells[row][col] = value
+        self.set_cell(row, col, value)
         return value
 
     def choose_random_bounds(self) -> tuple[CellIndex, CellIndex] | None:
         candidates = []
         for row in range(self.height):
             for col in range(self.width):
-                if self.cells[row][col] != CellType.WALL:
+                if self.get_cell_type(row, col) != CellType.WALL:
                     candidates.append((row, col))
         if candidates:
             start, end = random.choices(candidates, k=2)
@@ -90,3 +117,109 @@ class Grid:
             self.set_cell(*end, value=CellType.GOAL)
             return start, end
         return None
+
+
+CHUNK_SIZE = 64
+
+
+class ChunkedGrid(Grid):
+    # Grille creuse : les cellules sont regroupees en tuiles de chunk_size x chunk_size
+    # allouees uniquement quand elles contiennent au moins une cellule non vide
+    def __init__(self, width: int, height: int, chunk_size: int = CHUNK_SIZE):
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.chunks: dict[CellIndex, list[CellType]] = dict()
+        # Nombre de cellules non vides par tuile, pour liberer les tuiles redevenues vides
+        self.chunk_fill: dict[CellIndex, int] = dict()
+
+    def check_bounds(self, row: int, col: int):
+        # divmod accepte n'importe quel indice : sans ce test on creerait des tuiles hors grille
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"cell ({row}, {col}) out of grid")
+
+    def get_cell_type(self, row: int, col: int):
+        self.check_bounds(row, col)
+        chunk_row, local_row = divmod(row, self.chunk_size)
+        chunk_col, local_col = divmod(col, self.chunk_size)
+        chunk = self.chunks.get((chunk_row, chunk_col))
+        if chunk is None:
+            return CellType.EMPTY
+        return chunk[local_row * self.chunk_size + local_col]
+
+    def set_cell(self, row: int, col: int, value: CellType):
+        self.check_bounds(row, col)
+        chunk_row, local_row = divmod(row, self.chunk_size)
+        chunk_col, local_col = divmod(col, self.chunk_size)
+        key = (chunk_row, chunk_col)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if value == CellType.EMPTY:
+                return
+            chunk = [CellType.EMPTY] * (self.chunk_size * self.chunk_size)
+            self.chunks[key] = chunk
+            self.chunk_fill[key] = 0
+
+        index = local_row * self.chunk_size + local_col
+        previous = chunk[index]
+        chunk[index] = value
+        if previous == CellType.EMPTY and value != CellType.EMPTY:
+            self.chunk_fill[key] += 1
+        elif previous != CellType.EMPTY and value == CellType.EMPTY:
+            self.chunk_fill[key] -= 1
+            if self.chunk_fill[key] == 0:
+                del self.chunks[key]
+                del self.chunk_fill[key]
+
+    def reset(self):
+        self.chunks.clear()
+        self.chunk_fill.clear()
+
+    def free_cells(self) -> list[CellIndex]:
+        # Cellules non murs des tuiles allouees, plus une cellule d'une tuile non allouee
+        # s'il en existe une (les murs etant non vides, une telle tuile est entierement vide)
+        cells = []
+        for (chunk_row, chunk_col), chunk in self.chunks.items():
+            for index, cell_type in enumerate(chunk):
+                local_row, local_col = divmod(index, self.chunk_size)
+                row = chunk_row * self.chunk_size + local_row
+                col = chunk_col * self.chunk_size + local_col
+                if row < self.height and col < self.width and cell_type != CellType.WALL:
+                    cells.append((row, col))
+
+        chunk_rows = -(-self.height // self.chunk_size)
+        chunk_cols = -(-self.width // self.chunk_size)
+        if len(self.chunks) < chunk_rows * chunk_cols:
+            for chunk_row in range(chunk_rows):
+                for chunk_col in range(chunk_cols):
+                    if (chunk_row, chunk_col) not in self.chunks:
+                        cells.append(
+                            (chunk_row * self.chunk_size, chunk_col * self.chunk_size)
+                        )
+                        return cells
+        return cells
+
+    def choose_random_bounds(
+        self, max_tries: int = 1000
+    ) -> tuple[CellIndex, CellIndex] | None:
+        # Parcourir toutes les cellules est trop couteux sur une grande grille : on tire
+        # d'abord au plus max_tries cellules au hasard, puis si cela ne suffit pas on se
+        # rabat sur free_cells, dont le cout depend du nombre de tuiles allouees.
+        # Comme pour Grid, None n'est renvoye que si aucune cellule n'est libre.
+        candidates = []
+        for _ in range(max_tries):
+            cell = random.randrange(self.height), random.randrange(self.width)
+            if self.get_cell_type(*cell) != CellType.WALL:
+                candidates.append(cell)
+                if len(candidates) == 2:
+                    break
+        if len(candidates) < 2:
+            free_cells = self.free_cells()
+            if not free_cells:
+                return None
+            while len(candidates) < 2:
+                candidates.append(random.choice(free_cells))
+        start, end = candidates
+        self.set_cell(*start, value=CellType.BEGIN)
+        self.set_cell(*end, value=CellType.GOAL)
+        return start, end
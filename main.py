@@ -5,7 +5,7 @@ from tkinter import Canvas, Event, Tk
 from typing import Literal
 
 from algorithms import A_star, CellDynState, bfs, dijkstra
-from grid import CellIndex, CellType, Grid
+from grid import CellIndex, CellType, ChunkedGrid, Grid
 from gridview import GridView
 from labygen import GenerationState, dfs_maze
 
@@ -27,7 +27,7 @@ if __name__ == "__main__":
     canvas = Canvas(root, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, bg="gray70")
     canvas.pack()
 
-    grid = Grid(width=30, height=30)
+    grid = ChunkedGrid(width=30, height=30, chunk_size=8)
     gridview = GridView(grid, canvas, WINDOW_WIDTH, WINDOW_HEIGHT)
     gridview.draw_grid_init()
 